@@ -2,24 +2,32 @@
 """Analyze all job icons from the comprehensive sample."""
 
 from stgy_mini import decode_stgy
+from stgy_analyze_utils import hex_dump, dump_u16_fields
 import struct
+import sys
+
+_U32 = struct.Struct('<I').unpack_from
+_U16 = struct.Struct('<H').unpack_from
 
 # Sample with every class/job icon
 sample = "[stgy:aMr649woI0LSOuMMmfuj4TVEWpCUw2q6DLbeY2paX169t7i8DHN01kNraCx2m2EzeN-Wer8SndrycRuqilAdD3ciQHTzfKes086m4hLxf4juycL095He3w4Onejt3pIKG77e-Hf9MUX8fVPz2tTnSRPN+fbYyTBqvHXtA0g-DwcrK9e2Q6MXhje85OMcVbMgiMkgv03h872lvWzLhqkKZ4VAcfKo0eFcjoKz59lL5r8DFD8EfJUg3s5gvGc-qNHvaT+uDrWkxXA6r-Ne-m8LLNc2CcmAjhQkycIvEy+h6jiMtiO5+bFwOpLo3OFxzTuacEotvBrpEBOgNDIwoxf6AgGQ5mMmul6LtLRGMWoUy6R4WDM+cZKnLG6RVwjpzLxIAqp0UThV7idOfiPRiBRnZRvPBqV13uH+YR8Pgz5YqNvT3acSFojsOkQMyd6B6bvBw+aWoYW8EGA0ZvUN1O47D+DDohO0XOVVmeulnhfq1]"
 
 data = decode_stgy(sample)
+mv = memoryview(data)
+# Every u16 at an even offset, unpacked once; index with pos >> 1
+u16 = struct.unpack_from(f'<{len(data) // 2}H', data)
 
 print(f"Total decoded size: {len(data)} bytes")
 print()
 
 # Parse header
 print("=== HEADER ===")
-version = struct.unpack_from('<I', data, 0)[0]
-grid_size = struct.unpack_from('<I', data, 4)[0]
-payload_size = struct.unpack_from('<I', data, 0x12)[0]
-obj_count = struct.unpack_from('<H', data, 0x18)[0]
-name_len = struct.unpack_from('<H', data, 0x1A)[0]
-name = data[0x1C:0x1C+name_len].rstrip(b'\x00').decode('utf-8', errors='replace')
+version = _U32(data, 0)[0]
+grid_size = _U32(data, 4)[0]
+payload_size = _U32(data, 0x12)[0]
+obj_count = _U16(data, 0x18)[0]
+name_len = _U16(data, 0x1A)[0]
+name = mv[0x1C:0x1C+name_len].tobytes().rstrip(b'\x00').decode('utf-8', errors='replace')
 
 print(f"Version: {version}")
 print(f"Grid size: {grid_size}")
@@ -29,11 +37,7 @@ print(f"Name: '{name}'")
 
 # Full hex dump
 print("\n=== FULL HEX DUMP ===")
-for i in range(0, len(data), 16):
-    chunk = data[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    ascii_str = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-    print(f"{i:04x}: {hex_str:<48} {ascii_str}")
+sys.stdout.write(hex_dump(mv))
 
 # Now let's try to parse the objects
 print("\n=== PARSING OBJECTS ===")
@@ -46,8 +50,8 @@ obj_num = 0
 
 while pos < len(data) - 4:
     obj_num += 1
-    obj_type = struct.unpack_from('<H', data, pos)[0]
-    icon_id = struct.unpack_from('<H', data, pos+2)[0]
+    obj_type = u16[pos >> 1]
+    icon_id = u16[(pos >> 1) + 1]
     
     # Read ahead to find coordinates
     # From single-icon analysis, coords are at object+0x12 and object+0x14
@@ -62,20 +66,17 @@ while pos < len(data) - 4:
     
     # Show next 20 bytes as u16 values
     print(f"  Raw u16 values from 0x{pos:04X}:")
-    for i in range(0, 40, 2):
-        if pos + i + 2 <= len(data):
-            val = struct.unpack_from('<H', data, pos + i)[0]
-            print(f"    +{i:02X}: {val:5d} (0x{val:04X})")
+    sys.stdout.write(dump_u16_fields(data, pos, min(pos + 40, len(data)), "    "))
     
     # For now, assume each object is similar structure
     # Let's skip to next object marker (type=2)
     next_pos = pos + 4
     while next_pos < len(data) - 2:
-        val = struct.unpack_from('<H', data, next_pos)[0]
+        val = u16[next_pos >> 1]
         # Object type marker seems to be 2
         if val == 2 and next_pos > pos + 20:  # At least 20 bytes per object
             # Check if next value looks like a reasonable icon ID (30-100 range)
-            next_val = struct.unpack_from('<H', data, next_pos+2)[0]
+            next_val = u16[(next_pos >> 1) + 1]
             if 20 <= next_val <= 200:
                 break
         next_pos += 2
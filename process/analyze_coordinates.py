@@ -2,8 +2,11 @@
 """Analyze coordinate encoding in FF14 strategy boards."""
 
 from stgy_mini import decode_stgy
+from stgy_analyze_utils import diff_offsets_many
 import struct
 
+_U16 = struct.Struct('<H').unpack_from
+
 # All test cases with known coordinates
 samples = [
     ("x:0, y:0", "[stgy:aV6va-fqTem+7Jrx3lj55Yz0hsqPZQq5jbkqPazMEFQleuXfDlyx90VJ07yd+MNvWVehCSfGO1BUiBuddJgItSWfdq0xH3OHJMZOGr1dJ]"),
@@ -13,61 +16,67 @@ samples = [
     ("x:0, y:1", "[stgy:aY0quGEEpH216MPikxba1JOiAdfptdBqkcu-uQTxpHPyABB542FFAEq2UWsnDqy3OMIzwuLM6MWaU3KKHidJ-DgYY1HyXeYr3rXq8k5LUVHq]"),
 ]
 
-print("Coordinate Analysis")
-print("="*80)
-
-# Decode all and find differing bytes
-decoded_list = []
-for name, stgy in samples:
-    data = decode_stgy(stgy)
-    decoded_list.append((name, data))
-    
-# Focus on bytes that differ between samples
-# First, find all positions where any sample differs
-base = decoded_list[0][1]
-varying_positions = set()
-
-for name, data in decoded_list[1:]:
-    for i in range(min(len(base), len(data))):
-        if base[i] != data[i]:
-            varying_positions.add(i)
-
-print(f"Positions that vary across samples: {sorted(varying_positions)}")
-print()
-
-# Show values at varying positions for each sample
-print("Values at varying positions:")
-print("-"*80)
-header = f"{'Sample':<12}"
-for pos in sorted(varying_positions):
-    header += f" 0x{pos:02X}"
-print(header)
-print("-"*80)
-
-for name, data in decoded_list:
-    row = f"{name:<12}"
-    for pos in sorted(varying_positions):
-        val = data[pos] if pos < len(data) else 0
-        # Show as signed byte for potential negative coords
-        row += f" {val:4d}"
-    print(row)
-
-print()
-print("="*80)
-print("Hypothesis testing:")
-print()
-
-# The X coord changed at offset 54 (0x36) when going from x:0 to x:1
-# Let's see the pattern
-for name, data in decoded_list:
-    # Extract values at key positions as u16 little-endian
-    val_34 = struct.unpack_from('<H', data, 0x34)[0]
-    val_36 = struct.unpack_from('<H', data, 0x36)[0]  # This was X
-    val_38 = struct.unpack_from('<H', data, 0x38)[0]  # Maybe Y?
-    
-    print(f"{name}: offset 0x34={val_34:3d}, 0x36={val_36:3d}, 0x38={val_38:3d}")
-
-print()
-print("Analysis:")
-print("  - offset 0x36 appears to be X * 10")
-print("  - offset 0x38 appears to be Y * 10")
+def main():
+    print("Coordinate Analysis")
+    print("="*80)
+
+    # Decode all and find differing bytes
+    decoded_list = []
+    for name, stgy in samples:
+        data = decode_stgy(stgy)
+        decoded_list.append((name, data))
+
+    # Focus on bytes that differ between samples
+    # First, find all positions where any sample differs
+    base = decoded_list[0][1]
+    varying_positions = set()
+
+    others = [data for _, data in decoded_list[1:]]
+    for data, offsets in zip(others, diff_offsets_many(base, others)):
+        n = min(len(base), len(data))
+        varying_positions.update(i for i in offsets if i < n)
+
+    sorted_positions = sorted(varying_positions)
+    print(f"Positions that vary across samples: {sorted_positions}")
+    print()
+
+    # Show values at varying positions for each sample
+    print("Values at varying positions:")
+    print("-"*80)
+    header = f"{'Sample':<12}"
+    for pos in sorted_positions:
+        header += f" 0x{pos:02X}"
+    print(header)
+    print("-"*80)
+
+    for name, data in decoded_list:
+        row = f"{name:<12}"
+        for pos in sorted_positions:
+            val = data[pos] if pos < len(data) else 0
+            # Show as signed byte for potential negative coords
+            row += f" {val:4d}"
+        print(row)
+
+    print()
+    print("="*80)
+    print("Hypothesis testing:")
+    print()
+
+    # The X coord changed at offset 54 (0x36) when going from x:0 to x:1
+    # Let's see the pattern
+    for name, data in decoded_list:
+        # Extract values at key positions as u16 little-endian
+        val_34 = _U16(data, 0x34)[0]
+        val_36 = _U16(data, 0x36)[0]  # This was X
+        val_38 = _U16(data, 0x38)[0]  # Maybe Y?
+
+        print(f"{name}: offset 0x34={val_34:3d}, 0x36={val_36:3d}, 0x38={val_38:3d}")
+
+    print()
+    print("Analysis:")
+    print("  - offset 0x36 appears to be X * 10")
+    print("  - offset 0x38 appears to be Y * 10")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,30 @@
 from stgy_mini import decode_stgy
 import struct
 
+_U32 = struct.Struct('<I').unpack_from
+_U16 = struct.Struct('<H').unpack_from
+
 # Test case
 sample = "[stgy:aV6va-fqTem+7Jrx3lj55Yz0hsqPZQq5jbkqPazMEFQleuXfDlyx90VJ07yd+MNvWVehCSfGO1BUiBuddJgItSWfdq0xH3OHJMZOGr1dJ]"
 data = decode_stgy(sample)
+mv = memoryview(data)
 
 print("Full structure analysis:")
 print("="*60)
 
 # Parse header
-version = struct.unpack_from('<I', data, 0)[0]
-grid_size = struct.unpack_from('<I', data, 4)[0]
-payload_size = struct.unpack_from('<I', data, 0x12)[0]
+version = _U32(data, 0)[0]
+grid_size = _U32(data, 4)[0]
+payload_size = _U32(data, 0x12)[0]
 
 print(f"Offset 0x00: Version/Format = {version}")
 print(f"Offset 0x04: Grid Size? = {grid_size}")
 print(f"Offset 0x12: Payload Size? = {payload_size}")
 
 # Parse name section
-obj_count = struct.unpack_from('<H', data, 0x18)[0]
-name_len = struct.unpack_from('<H', data, 0x1A)[0]
-name = data[0x1C:0x1C+8].rstrip(b'\x00').decode('utf-8')
+obj_count = _U16(data, 0x18)[0]
+name_len = _U16(data, 0x1A)[0]
+name = mv[0x1C:0x1C+8].tobytes().rstrip(b'\x00').decode('utf-8')
 
 print(f"Offset 0x18: Object Count = {obj_count}")
 print(f"Offset 0x1A: Name Field Length = {name_len}")
@@ -35,14 +39,11 @@ obj_start = 0x24
 print(f"\n--- Object Data (starting at 0x{obj_start:02X}) ---")
 
 # Let's interpret this as a series of tag-length-value or similar
-pos = obj_start
-while pos < len(data) - 2:
-    tag = struct.unpack_from('<H', data, pos)[0]
-    # Try to interpret the next bytes
-    if pos + 4 <= len(data):
-        val16 = struct.unpack_from('<H', data, pos+2)[0]
-        print(f"  0x{pos:02X}: Tag={tag:04X} (dec:{tag:3d}), Next u16 = {val16}")
-    pos += 2
+# Every u16 from obj_start, unpacked once
+obj_vals = struct.unpack_from(f'<{(len(data) - obj_start) // 2}H', data, obj_start)
+for i, (tag, val16) in enumerate(zip(obj_vals, obj_vals[1:])):
+    pos = obj_start + i * 2
+    print(f"  0x{pos:02X}: Tag={tag:04X} (dec:{tag:3d}), Next u16 = {val16}")
 
 print("\n--- Annotated Object Fields (hypothesis) ---")
 # Based on offsets 54 being X, let's work backwards
@@ -50,12 +51,9 @@ print("\n--- Annotated Object Fields (hypothesis) ---")
 
 # Let me show the object bytes with annotations
 print("\nRaw object bytes from 0x24:")
-obj_data = data[0x24:]
-for i in range(0, len(obj_data), 2):
-    if i + 2 <= len(obj_data):
-        val = struct.unpack_from('<H', obj_data, i)[0]
-        abs_offset = 0x24 + i
-        note = ""
-        if abs_offset == 0x36:
-            note = " <-- X coordinate (0 * 10 = 0)"
-        print(f"  0x{abs_offset:02X} (obj+{i:02X}): {val:5d} (0x{val:04X}){note}")
+for i, val in zip(range(0, len(obj_vals) * 2, 2), obj_vals):
+    abs_offset = 0x24 + i
+    note = ""
+    if abs_offset == 0x36:
+        note = " <-- X coordinate (0 * 10 = 0)"
+    print(f"  0x{abs_offset:02X} (obj+{i:02X}): {val:5d} (0x{val:04X}){note}")
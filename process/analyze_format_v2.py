@@ -4,15 +4,19 @@
 from stgy_mini import decode_stgy
 import struct
 
+_U16 = struct.Struct('<H').unpack_from
+
 # Sample with every class/job icon
 sample = "[stgy:aMr649woI0LSOuMMmfuj4TVEWpCUw2q6DLbeY2paX169t7i8DHN01kNraCx2m2EzeN-Wer8SndrycRuqilAdD3ciQHTzfKes086m4hLxf4juycL095He3w4Onejt3pIKG77e-Hf9MUX8fVPz2tTnSRPN+fbYyTBqvHXtA0g-DwcrK9e2Q6MXhje85OMcVbMgiMkgv03h872lvWzLhqkKZ4VAcfKo0eFcjoKz59lL5r8DFD8EfJUg3s5gvGc-qNHvaT+uDrWkxXA6r-Ne-m8LLNc2CcmAjhQkycIvEy+h6jiMtiO5+bFwOpLo3OFxzTuacEotvBrpEBOgNDIwoxf6AgGQ5mMmul6LtLRGMWoUy6R4WDM+cZKnLG6RVwjpzLxIAqp0UThV7idOfiPRiBRnZRvPBqV13uH+YR8Pgz5YqNvT3acSFojsOkQMyd6B6bvBw+aWoYW8EGA0ZvUN1O47D+DDohO0XOVVmeulnhfq1]"
 
 data = decode_stgy(sample)
+# Every u16 at an even offset, unpacked once; index with pos >> 1
+u16 = struct.unpack_from(f'<{len(data) // 2}H', data)
 
 print(f"Total decoded size: {len(data)} bytes")
 
 # Parse header
-obj_count = struct.unpack_from('<H', data, 0x18)[0]
+obj_count = u16[0x18 >> 1]
 print(f"Object count in header: {obj_count}")
 
 # The pattern at 0x24 seems to be a series of "02 00 XX 00" entries
@@ -22,8 +26,8 @@ print("\n=== ICON ID LIST (pattern: 02 00 XX 00) ===")
 icon_ids = []
 pos = 0x24
 while pos < len(data) - 4:
-    marker = struct.unpack_from('<H', data, pos)[0]
-    icon_id = struct.unpack_from('<H', data, pos+2)[0]
+    marker = u16[pos >> 1]
+    icon_id = u16[(pos >> 1) + 1]
     
     # Check if this looks like the pattern
     if marker == 2 and icon_id < 200:  # Reasonable icon ID range
@@ -49,7 +53,7 @@ print(f"Remaining data length: {len(remaining)} bytes")
 # Show the next few u16 values
 print("\nNext values (u16 LE):")
 for i in range(0, min(40, len(remaining)), 2):
-    val = struct.unpack_from('<H', remaining, i)[0]
+    val = u16[(pos + i) >> 1]
     print(f"  0x{pos+i:04X}: {val:5d} (0x{val:04X})")
 
 # Look for the coordinate section - might start with tag 0x05
@@ -59,7 +63,7 @@ if coord_start >= 0:
     print(f"\n=== COORDINATE SECTION (found at 0x{coord_start:04X}) ===")
     
     # After the header [05 00 03 00 count], we should have pairs of coordinates
-    count = struct.unpack_from('<H', data, coord_start + 4)[0]
+    count = _U16(data, coord_start + 4)[0]
     print(f"Coordinate count: {count}")
     
     # Read coordinate pairs (each is u16 x, u16 y)
@@ -68,8 +72,8 @@ if coord_start >= 0:
     for i in range(min(count, len(icon_ids))):
         if coord_pos + 4 > len(data):
             break
-        x = struct.unpack_from('<H', data, coord_pos)[0]
-        y = struct.unpack_from('<H', data, coord_pos + 2)[0]
+        x = _U16(data, coord_pos)[0]
+        y = _U16(data, coord_pos + 2)[0]
         coords.append((x, y))
         coord_pos += 4
     
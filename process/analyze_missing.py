@@ -4,6 +4,8 @@
 from stgy_mini import decode_stgy
 import struct
 
+_U16 = struct.Struct('<H').unpack_from
+
 # 2-object game code
 game_code = "[stgy:aTHOjrINWUqOLJfJKCRoOv7gOFSK0Icl1ySdZY69V9-gaA+rFXS1lC1KCkcBkGfeTsUQ0P113b47n7Jx4G6dltP9218j9-F8+L4sk6537Qfine-SYiks-y+j-n53]"
 binary = decode_stgy(game_code)
@@ -17,7 +19,7 @@ print("=" * 70)
 pos = 0x2C
 print(f"\n0x{pos:02X}: Tag 0x04 section")
 for i in range(20):
-    val = struct.unpack_from('<H', binary, pos + i*2)[0]
+    val = _U16(binary, pos + i*2)[0]
     print(f"  0x{pos + i*2:02X}: {val:5d} (0x{val:04X})")
 
 # Look at the game structure more carefully
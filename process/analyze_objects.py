@@ -2,6 +2,8 @@
 """Analyze FF14 strategy board object format by comparing payloads."""
 
 from stgy_mini import decode_stgy
+from stgy_analyze_utils import hex_dump, diff_offsets
+import sys
 
 # Test cases provided by user
 samples = [
@@ -10,24 +12,11 @@ samples = [
     ("test1 at x:1,y:0", "[stgy:a+1MY3P6OnyrkV0fI4cpp1aAiF6-CJ6pczG652wbnG+OSrTERujfWgRwTnbuT5ws5BzYe4JrXPoo8pJJuZIjI1qEAvsrEY6d7SR0VvHYqE1u]"),
 ]
 
-def hex_dump(data, prefix=""):
-    """Print hex dump of binary data."""
-    for i in range(0, len(data), 16):
-        chunk = data[i:i+16]
-        hex_str = " ".join(f"{b:02x}" for b in chunk)
-        ascii_str = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        print(f"{prefix}{i:04x}: {hex_str:<48} {ascii_str}")
-
 def compare_bytes(name1, data1, name2, data2):
     """Compare two byte sequences and show differences."""
     print(f"\n=== Comparing {name1} vs {name2} ===")
-    max_len = max(len(data1), len(data2))
-    diffs = []
-    for i in range(max_len):
-        b1 = data1[i] if i < len(data1) else None
-        b2 = data2[i] if i < len(data2) else None
-        if b1 != b2:
-            diffs.append((i, b1, b2))
+    diffs = [(i, data1[i] if i < len(data1) else None, data2[i] if i < len(data2) else None)
+             for i in diff_offsets(data1, data2)]
     
     print(f"Length difference: {len(data1)} vs {len(data2)}")
     print(f"Number of byte differences: {len(diffs)}")
@@ -50,7 +39,7 @@ if __name__ == "__main__":
         print(f"Decoded length: {len(result)} bytes")
         print(f"\nRaw bytes: {result}")
         print(f"\nHex dump:")
-        hex_dump(result)
+        sys.stdout.write(hex_dump(result))
     
     # Compare the samples
     print("\n" + "="*60)
@@ -4,6 +4,8 @@
 from stgy_mini import decode_stgy
 import struct
 
+_U16 = struct.Struct('<H').unpack_from
+
 # Multi-icon sample
 sample = "[stgy:aMr649woI0LSOuMMmfuj4TVEWpCUw2q6DLbeY2paX169t7i8DHN01kNraCx2m2EzeN-Wer8SndrycRuqilAdD3ciQHTzfKes086m4hLxf4juycL095He3w4Onejt3pIKG77e-Hf9MUX8fVPz2tTnSRPN+fbYyTBqvHXtA0g-DwcrK9e2Q6MXhje85OMcVbMgiMkgv03h872lvWzLhqkKZ4VAcfKo0eFcjoKz59lL5r8DFD8EfJUg3s5gvGc-qNHvaT+uDrWkxXA6r-Ne-m8LLNc2CcmAjhQkycIvEy+h6jiMtiO5+bFwOpLo3OFxzTuacEotvBrpEBOgNDIwoxf6AgGQ5mMmul6LtLRGMWoUy6R4WDM+cZKnLG6RVwjpzLxIAqp0UThV7idOfiPRiBRnZRvPBqV13uH+YR8Pgz5YqNvT3acSFojsOkQMyd6B6bvBw+aWoYW8EGA0ZvUN1O47D+DDohO0XOVVmeulnhfq1]"
 
@@ -28,12 +30,8 @@ print("=" * 60)
 def find_section(data, tag):
     """Find a section by its tag and return offset."""
     tag_bytes = struct.pack('<H', tag)
-    pos = 0
-    while pos < len(data) - 2:
-        if data[pos:pos+2] == tag_bytes:
-            return pos
-        pos += 1
-    return -1
+    # Matches must start before len(data) - 2, same as the old byte-by-byte scan
+    return data.find(tag_bytes, 0, len(data) - 1)
 
 # Find each section
 sections = {}
@@ -56,8 +54,8 @@ for tag in sorted(sections.keys()):
     print(f"\n### Tag 0x{tag:02X} at 0x{pos:04X}:")
     
     # Read header: tag(u16), maybe type/count(u16), then data
-    tag_val = struct.unpack_from('<H', data, pos)[0]
-    next_val = struct.unpack_from('<H', data, pos+2)[0]
+    tag_val = _U16(data, pos)[0]
+    next_val = _U16(data, pos+2)[0]
     
     if tag == 0x07:
         # Suspected SIZE section
@@ -79,7 +77,7 @@ for tag in sorted(sections.keys()):
         values = []
         for i in range(min(icon_count * 2, 20)):
             if start + i * 2 + 2 <= len(data):
-                val = struct.unpack_from('<H', data, start + i * 2)[0]
+                val = _U16(data, start + i * 2)[0]
                 values.append(val)
         print(f"  First values (u16): {values[:10]}")
         
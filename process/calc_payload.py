@@ -4,6 +4,8 @@
 from stgy_mini import decode_stgy
 import struct
 
+_U32 = struct.Struct('<I').unpack_from
+
 # Original code
 original_code = "[stgy:aV6va-fqTem+7Jrx3lj55Yz0hsqPZQq5jbkqPazMEFQleuXfDlyx90VJ07yd+MNvWVehCSfGO1BUiBuddJgItSWfdq0xH3OHJMZOGr1dJ]"
 original_binary = decode_stgy(original_code)
@@ -19,7 +21,7 @@ header_len = 0x24
 print(f"Header length: {header_len} bytes")
 
 # What's at offset 0x12?
-payload_size_field = struct.unpack_from('<I', original_binary, 0x12)[0]
+payload_size_field = _U32(original_binary, 0x12)[0]
 print(f"Payload size field (at 0x12): {payload_size_field} (0x{payload_size_field:02x})")
 
 # Is it total - header?
@@ -2,6 +2,8 @@
 """Compare board background samples to find the location."""
 
 from stgy_mini import decode_stgy
+from stgy_analyze_utils import diff_offsets_many, hex_rows
+import sys
 
 # All background samples - empty boards named 'abcdefg'
 samples = [
@@ -20,10 +22,7 @@ for name, code in samples:
     binary = decode_stgy(code)
     decoded.append((name, binary))
     print(f"\n=== {name} ({len(binary)} bytes) ===")
-    for i in range(0, len(binary), 16):
-        chunk = binary[i:i+16]
-        hex_str = " ".join(f"{b:02x}" for b in chunk)
-        print(f"{i:04x}: {hex_str}")
+    sys.stdout.write(hex_rows(binary))
 
 # Compare all samples to find differences
 print("\n" + "=" * 70)
@@ -31,14 +30,10 @@ print("COMPARING ALL SAMPLES (showing differences)")
 print("=" * 70)
 
 base_name, base_binary = decoded[0]
-for name, binary in decoded[1:]:
-    diffs = []
-    max_len = max(len(base_binary), len(binary))
-    for i in range(max_len):
-        b = base_binary[i] if i < len(base_binary) else None
-        c = binary[i] if i < len(binary) else None
-        if b != c:
-            diffs.append((i, b, c))
+rows = diff_offsets_many(base_binary, [binary for _, binary in decoded[1:]])
+for (name, binary), offsets in zip(decoded[1:], rows):
+    diffs = [(i, base_binary[i] if i < len(base_binary) else None, binary[i] if i < len(binary) else None)
+             for i in offsets]
     
     print(f"\n{base_name} vs {name}: {len(diffs)} differences")
     for offset, base_val, curr_val in diffs[:10]:
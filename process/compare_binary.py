@@ -4,6 +4,8 @@
 from stgy_mini import decode_stgy as decode_original
 from stgy_encoder import build_binary
 import json
+import sys
+from stgy_analyze_utils import hex_rows, diff_offsets
 
 # Known working original
 original_code = "[stgy:aV6va-fqTem+7Jrx3lj55Yz0hsqPZQq5jbkqPazMEFQleuXfDlyx90VJ07yd+MNvWVehCSfGO1BUiBuddJgItSWfdq0xH3OHJMZOGr1dJ]"
@@ -28,25 +30,14 @@ print(f"Original length: {len(original_binary)} bytes")
 print(f"Encoder length: {len(my_binary)} bytes")
 
 print("\n--- ORIGINAL HEX ---")
-for i in range(0, len(original_binary), 16):
-    chunk = original_binary[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    print(f"{i:04x}: {hex_str}")
+sys.stdout.write(hex_rows(original_binary))
 
 print("\n--- ENCODER OUTPUT HEX ---")
-for i in range(0, len(my_binary), 16):
-    chunk = my_binary[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    print(f"{i:04x}: {hex_str}")
+sys.stdout.write(hex_rows(my_binary))
 
 print("\n--- BYTE-BY-BYTE DIFF ---")
-max_len = max(len(original_binary), len(my_binary))
-diffs = []
-for i in range(max_len):
-    orig = original_binary[i] if i < len(original_binary) else None
-    mine = my_binary[i] if i < len(my_binary) else None
-    if orig != mine:
-        diffs.append((i, orig, mine))
+diffs = [(i, original_binary[i] if i < len(original_binary) else None, my_binary[i] if i < len(my_binary) else None)
+         for i in diff_offsets(original_binary, my_binary)]
 
 print(f"Total differences: {len(diffs)}")
 for offset, orig, mine in diffs[:30]:  # Show first 30
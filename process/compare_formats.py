@@ -3,7 +3,9 @@
 
 from stgy_mini import decode_stgy as decode_raw
 from stgy_encoder import build_binary
+from stgy_analyze_utils import hex_dump
 import json
+import sys
 
 # Original working game code
 game_code = "[stgy:aV6va-fqTem+7Jrx3lj55Yz0hsqPZQq5jbkqPazMEFQleuXfDlyx90VJ07yd+MNvWVehCSfGO1BUiBuddJgItSWfdq0xH3OHJMZOGr1dJ]"
@@ -17,19 +19,11 @@ my_binary = build_binary(my_json)
 
 print("=== GAME BINARY ===")
 print(f"Length: {len(game_binary)}")
-for i in range(0, len(game_binary), 16):
-    chunk = game_binary[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    ascii_str = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-    print(f"{i:04x}: {hex_str:<48} {ascii_str}")
+sys.stdout.write(hex_dump(game_binary))
 
 print("\n=== MY BINARY ===")
 print(f"Length: {len(my_binary)}")
-for i in range(0, len(my_binary), 16):
-    chunk = my_binary[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    ascii_str = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-    print(f"{i:04x}: {hex_str:<48} {ascii_str}")
+sys.stdout.write(hex_dump(my_binary))
 
 print("\n=== DIFFERENCES ===")
 max_len = max(len(game_binary), len(my_binary))
@@ -4,13 +4,16 @@
 from stgy_mini import decode_stgy
 from stgy_encoder import build_binary
 import json
+import sys
+from stgy_analyze_utils import hex_rows, diff_offsets
 
 # Game-produced share code (2 objects)
 game_code = "[stgy:aTHOjrINWUqOLJfJKCRoOv7gOFSK0Icl1ySdZY69V9-gaA+rFXS1lC1KCkcBkGfeTsUQ0P113b47n7Jx4G6dltP9218j9-F8+L4sk6537Qfine-SYiks-y+j-n53]"
 
 # My encoder input
-with open("test_party.json", "r") as f:
-    my_json = json.load(f)
+# Read raw bytes; json.loads detects the encoding itself
+with open("test_party.json", "rb") as f:
+    my_json = json.loads(f.read())
 
 # Decode game version
 game_binary = decode_stgy(game_code)
@@ -24,25 +27,14 @@ print(f"Game binary length: {len(game_binary)} bytes")
 print(f"Script binary length: {len(my_binary)} bytes")
 
 print("\n--- GAME HEX ---")
-for i in range(0, len(game_binary), 16):
-    chunk = game_binary[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    print(f"{i:04x}: {hex_str}")
+sys.stdout.write(hex_rows(game_binary))
 
 print("\n--- SCRIPT HEX ---")
-for i in range(0, len(my_binary), 16):
-    chunk = my_binary[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    print(f"{i:04x}: {hex_str}")
+sys.stdout.write(hex_rows(my_binary))
 
 print("\n--- BYTE-BY-BYTE DIFF ---")
-max_len = max(len(game_binary), len(my_binary))
-diffs = []
-for i in range(max_len):
-    game_byte = game_binary[i] if i < len(game_binary) else None
-    my_byte = my_binary[i] if i < len(my_binary) else None
-    if game_byte != my_byte:
-        diffs.append((i, game_byte, my_byte))
+diffs = [(i, game_binary[i] if i < len(game_binary) else None, my_binary[i] if i < len(my_binary) else None)
+         for i in diff_offsets(game_binary, my_binary)]
 
 print(f"Total differences: {len(diffs)}")
 for offset, game_val, my_val in diffs[:30]:
@@ -4,6 +4,8 @@
 from stgy_mini import decode_stgy
 from stgy_encoder import build_binary
 import json
+import sys
+from stgy_analyze_utils import hex_rows, diff_offsets
 import struct
 
 # Working 2-tank code
@@ -16,49 +18,36 @@ three_tank = "[stgy:aklLqnNdh-xGA78VQqbo8Zrl6rJOxMo9yvezx2YtoyU00EWt7zTZERL5hras
 four_tank = "[stgy:a0PkzO4TQSQA8rHpf1QY6FknmkZNO5z7Jau1ZM9rBmJgQm6Y1B0yAMVq+f6PI1jxku0ae1BelEjEAfFeWDQAMeFBBQJwvIaHjy+92pyakic3mLqWMg]"
 
 # My JSON
-with open("test_party.json", "r") as f:
-    my_json = json.load(f)
+# Read raw bytes; json.loads detects the encoding itself
+with open("test_party.json", "rb") as f:
+    my_json = json.loads(f.read())
 
 game_binary = decode_stgy(two_tank)
 my_binary = build_binary(my_json)
 
 print("=== 2-TANK GAME BINARY ===")
 print(f"Length: {len(game_binary)}")
-for i in range(0, len(game_binary), 16):
-    chunk = game_binary[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    print(f"{i:04x}: {hex_str}")
+sys.stdout.write(hex_rows(game_binary))
 
 print("\n=== MY BINARY (2 tanks) ===")
 print(f"Length: {len(my_binary)}")
-for i in range(0, len(my_binary), 16):
-    chunk = my_binary[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    print(f"{i:04x}: {hex_str}")
+sys.stdout.write(hex_rows(my_binary))
 
 print("\n=== DIFFERENCES ===")
-max_len = max(len(game_binary), len(my_binary))
-for i in range(max_len):
+for i in diff_offsets(game_binary, my_binary):
     g = game_binary[i] if i < len(game_binary) else None
     m = my_binary[i] if i < len(my_binary) else None
-    if g != m:
-        g_str = f"0x{g:02x}" if g is not None else "None"
-        m_str = f"0x{m:02x}" if m is not None else "None"
-        print(f"  0x{i:02X}: game={g_str}, mine={m_str}")
+    g_str = f"0x{g:02x}" if g is not None else "None"
+    m_str = f"0x{m:02x}" if m is not None else "None"
+    print(f"  0x{i:02X}: game={g_str}, mine={m_str}")
 
 # Also analyze 3 and 4 tank versions
 print("\n=== 3-TANK GAME BINARY ===")
 three = decode_stgy(three_tank)
 print(f"Length: {len(three)}")
-for i in range(0, len(three), 16):
-    chunk = three[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    print(f"{i:04x}: {hex_str}")
+sys.stdout.write(hex_rows(three))
 
 print("\n=== 4-TANK GAME BINARY ===")
 four = decode_stgy(four_tank)
 print(f"Length: {len(four)}")
-for i in range(0, len(four), 16):
-    chunk = four[i:i+16]
-    hex_str = " ".join(f"{b:02x}" for b in chunk)
-    print(f"{i:04x}: {hex_str}")
+sys.stdout.write(hex_rows(four))
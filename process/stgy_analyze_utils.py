@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Shared helpers for the analysis scripts: raw share code decoding and dumps."""
+
+import base64
+import re
+import struct
+import zlib
+
+from _stgy_tables import (
+    DAT_1420cf520, FORWARD_LUT, KEY_REVERSE, B64_ALPHABET, B64_TO_VAL,
+    encode_tables, decode_tables, cipher_translate,
+)
+
+# Share code character for each base64 value (the INVERSE_DAT_1420cf4a0
+# substitution composed with the standard base64 alphabet)
+CIPHER_ALPHABET = bytes(FORWARD_LUT[c] for c in B64_ALPHABET)
+
+def decode_to_raw(stgy_string):
+    """Decode share code to get raw header+compressed data."""
+    return decode_many_to_raw([stgy_string])[0]
+
+def decode_many_to_raw(stgy_strings):
+    """Decode several share codes to raw header+compressed data in one batch."""
+    return [base64.b64decode(b64_string + "==") for b64_string in decode_many_to_b64(stgy_strings)]
+
+def decode_stgy_full(stgy_string):
+    """Decode a share code once into (raw, compressed, binary)."""
+    raw = decode_to_raw(stgy_string)
+    compressed = raw[6:]
+    # The length field in the header sizes the output buffer up front
+    length = int.from_bytes(raw[4:6], 'little')
+    return raw, compressed, zlib.decompress(compressed, bufsize=length or zlib.DEF_BUF_SIZE)
+
+# zlib FLG bits 6-7 (FLEVEL) -> the compression levels that write that value
+_FLEVEL_LEVELS = ((0, 1), (2, 3, 4, 5), (6,), (7, 8, 9))
+
+def zlib_levels(compressed):
+    """Compression levels consistent with a zlib stream's FLG header byte."""
+    return _FLEVEL_LEVELS[compressed[1] >> 6]
+
+def compress_levels(data, levels):
+    """zlib.compress(data, level) for each level, compressing each distinct level once."""
+    # Z_DEFAULT_COMPRESSION (-1) is level 6 and produces identical output
+    effective = {level: 6 if level == zlib.Z_DEFAULT_COMPRESSION else level for level in levels}
+    by_effective = {level: zlib.compress(data, level) for level in set(effective.values())}
+    return {level: by_effective[e] for level, e in effective.items()}
+
+def decode_to_b64(stgy_string):
+    """Undo the share code cipher, giving the standard base64 string (unpadded)."""
+    return decode_many_to_b64([stgy_string])[0]
+
+def decode_many_to_b64(stgy_strings):
+    """Undo the share code cipher for several codes."""
+    b64_strings = []
+    for s in stgy_strings:
+        body = s[7:-1]
+        # Key characters past the end of DAT_1420cf520 raise IndexError, as in the other decoders
+        key = B64_TO_VAL[DAT_1420cf520[ord(body[0])]]
+        # Non-ASCII becomes '?', which decodes as 0 like any unknown character
+        decoded = cipher_translate(body[1:].encode('ascii', 'replace'), decode_tables(key))
+        b64_strings.append(decoded.decode('ascii'))
+    return b64_strings
+
+# Byte -> itself if printable ASCII, else '.'
+_ASCII_TABLE = bytes(i if 32 <= i < 127 else 46 for i in range(256))
+
+def encode_raw_to_body(raw_data, key):
+    """Apply the share code cipher to raw header+compressed data (key char not included)."""
+    body = base64.b64encode(raw_data).rstrip(b'=')
+    return cipher_translate(body, encode_tables(key & 63)).decode('ascii')
+
+def hex_dump(data, prefix=""):
+    """Format a hex dump of binary data as a single string."""
+    mv = memoryview(data)
+    lines = []
+    for i in range(0, len(data), 16):
+        chunk = mv[i:i+16]
+        ascii_str = chunk.tobytes().translate(_ASCII_TABLE).decode('ascii')
+        lines.append(f"{prefix}{i:04x}: {chunk.hex(' '):<48} {ascii_str}\n")
+    return "".join(lines)
+
+def hex_rows(data):
+    """Format offset + hex bytes rows (no ASCII column) as a single string."""
+    mv = memoryview(data)
+    return "".join(f"{i:04x}: {mv[i:i+16].hex(' ')}\n" for i in range(0, len(data), 16))
+
+def dump_u16_fields(data, start=0, end=None, prefix="  "):
+    """Format every little-endian u16 from start to end, one per line."""
+    if end is None:
+        end = len(data)
+    vals = struct.unpack_from(f'<{max(end - start, 0) // 2}H', data, start)
+    return "".join(f"{prefix}+{i * 2:02X}: {val:5d} (0x{val:04X})\n" for i, val in enumerate(vals))
+
+def diff_offsets(data1, data2):
+    """Offsets where two byte sequences differ, including the longer one's tail."""
+    n = min(len(data1), len(data2))
+    # XOR the common prefix as big integers; differing bytes are the non-zero ones
+    xored = (int.from_bytes(data1[:n], 'little') ^ int.from_bytes(data2[:n], 'little')).to_bytes(n, 'little')
+    offsets = [m.start() for m in re.finditer(rb'[^\x00]', xored)]
+    offsets.extend(range(n, max(len(data1), len(data2))))
+    return offsets
+
+def diff_offsets_many(base, others):
+    """diff_offsets(base, other) for each of others, from a single XOR over all rows."""
+    width = max([len(base), *map(len, others)])
+    # Stack the zero-padded rows and XOR them against the base repeated once per row
+    stacked = b"".join(other.ljust(width, b"\x00") for other in others)
+    repeated = base.ljust(width, b"\x00") * len(others)
+    xored = (int.from_bytes(stacked, 'little') ^ int.from_bytes(repeated, 'little')).to_bytes(len(stacked), 'little')
+    rows = [[] for _ in others]
+    for m in re.finditer(rb'[^\x00]', xored):
+        row, offset = divmod(m.start(), width)
+        rows[row].append(offset)
+    # Padding can hide differences past the shorter input; every such offset differs
+    for row, other in zip(rows, others):
+        n = min(len(base), len(other))
+        row[:] = [offset for offset in row if offset < n]
+        row.extend(range(n, max(len(base), len(other))))
+    return rows
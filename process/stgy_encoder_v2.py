@@ -10,53 +10,20 @@ import struct
 import json
 import sys
 import random
+import os
 
-# Cipher tables (same as before)
-INVERSE_DAT = {
-    98: 45, 50: 48, 119: 49, 55: 50, 113: 51, 83: 52, 116: 53, 69: 54,
-    86: 55, 52: 56, 80: 57, 102: 65, 82: 66, 101: 67, 65: 68, 70: 69,
-    66: 70, 117: 71, 100: 72, 107: 73, 54: 74, 51: 75, 75: 76, 76: 77,
-    43: 78, 89: 79, 45: 80, 122: 81, 84: 82, 53: 83, 68: 84, 110: 85,
-    72: 86, 104: 87, 81: 88, 85: 89, 57: 90, 87: 95, 71: 97, 90: 98,
-    73: 99, 106: 100, 78: 101, 114: 102, 49: 103, 109: 104, 97: 105,
-    79: 106, 112: 107, 111: 108, 77: 109, 88: 110, 105: 111, 74: 112,
-    108: 113, 103: 114, 56: 115, 67: 116, 120: 117, 99: 118, 118: 119,
-    48: 120, 115: 121, 121: 122,
-}
-
-# Forward mapping for encoding
-FORWARD_DAT = {v: k for k, v in INVERSE_DAT.items()}
-
-DAT_1420cf520 = (
-    b"\x00" * 43
-    + b"N\x00P\x00\x00xg0K8SJ2sZ\x00\x00\x00\x00\x00\x00\x00DFtT6EaVcpLMmej9XB4RY7_nOb\x00\x00\x00\x00\x00\x00i-vHCArWodIqhUlk3fy5Gw1uzQ"
-)
-
-# Reverse the key mapping
-KEY_REVERSE = {}
-for i in range(len(DAT_1420cf520)):
-    if DAT_1420cf520[i] != 0:
-        KEY_REVERSE[DAT_1420cf520[i]] = i
-
-
-def char_to_base64_value(c):
-    o = ord(c)
-    if 65 <= o <= 90: return o - 65
-    if 97 <= o <= 122: return o - 71
-    if 48 <= o <= 57: return o + 4
-    if c == "-": return 62
-    if c == "_": return 63
-    return 0
-
+# Cipher tables are shared with the decoders and stgy_encoder in ../python;
+# put that directory on the path so this script still runs on its own
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "python"))
+from _stgy_tables import KEY_REVERSE, B64_ALPHABET, encode_tables, cipher_translate
 
-def base64_value_to_char(val):
-    val &= 63
-    if val < 26: return chr(val + 65)
-    if val < 52: return chr(val + 71)
-    if val < 62: return chr(val - 4)
-    if val == 62: return "-"
-    if val == 63: return "_"
-    return "A"
+# Precompiled packers
+_H = struct.Struct('<H').pack
+_HH = struct.Struct('<HH').pack
+_HHH = struct.Struct('<HHH').pack
+_HHHH = struct.Struct('<HHHH').pack
+_I = struct.Struct('<I').pack
+_I_into = struct.Struct('<I').pack_into
 
 
 def encode_to_share_code(binary_data):
@@ -73,35 +40,21 @@ def encode_to_share_code(binary_data):
     # Combine header + compressed
     full_data = header + compressed
     
-    # Base64 encode
-    b64 = base64.b64encode(full_data).decode('ascii')
-    # Remove padding
-    b64 = b64.rstrip('=')
-    # Convert to URL-safe
-    b64 = b64.replace('+', '-').replace('/', '_')
+    # Base64 encode and remove padding; the cipher tables take the standard
+    # alphabet, so the data stays bytes with no URL-safe conversion pass
+    body = base64.b64encode(full_data).rstrip(b'=')
     
     # Pick a key (0-63)
-    key = random.randint(0, 63)
+    key = random.getrandbits(6)
     
     # Find key source character
-    key_standard = base64_value_to_char(key)
-    key_source_ord = KEY_REVERSE.get(ord(key_standard), ord('V'))
+    key_source_ord = KEY_REVERSE[B64_ALPHABET[key & 63]] or ord('V')
     key_source = chr(key_source_ord)
     
     # Apply cipher encoding
-    encoded = []
-    for i, c in enumerate(b64):
-        # Get base64 value
-        val = char_to_base64_value(c)
-        # Apply forward cipher: (val + i + key) & 0x3f
-        encoded_val = (val + i + key) & 63
-        # Convert to standard
-        standard_char = base64_value_to_char(encoded_val)
-        # Apply substitution
-        subst = chr(FORWARD_DAT.get(ord(standard_char), ord('A')))
-        encoded.append(subst)
-    
-    return f"[stgy:a{key_source}{''.join(encoded)}]"
+    encoded = cipher_translate(body, encode_tables(key))
+    
+    return f"[stgy:a{key_source}{encoded.decode('ascii')}]"
 
 
 # Object type mappings
@@ -119,105 +72,89 @@ def build_binary(data):
     objects = data.get("objects", [])
     n = len(objects)
     
-    result = bytearray()
+    # Collect the payload as parts and join once at the end
+    parts = []
     
     # Header (0x00 - 0x23) - 36 bytes
-    result += struct.pack('<I', 2)           # 0x00: Version
-    result += struct.pack('<I', 100)         # 0x04: Grid size
-    result += b'\x00' * 10                   # 0x08: Padding
+    parts.append(_I(2))                      # 0x00: Version
+    parts.append(_I(100))                    # 0x04: Grid size
+    parts.append(b'\x00' * 10)               # 0x08: Padding
     # 0x12: Payload size - will calculate and set later
-    result += struct.pack('<I', 0)           
-    result += struct.pack('<H', 0)           # 0x16: Padding
-    result += struct.pack('<H', 1)           # 0x18: Object count
-    result += struct.pack('<H', 8)           # 0x1A: Name length
+    parts.append(_I(0))
+    parts.append(_H(0))                      # 0x16: Padding
+    parts.append(_H(1))                      # 0x18: Object count
+    parts.append(_H(8))                      # 0x1A: Name length
     name_bytes = name.encode('utf-8')[:8].ljust(8, b'\x00')
-    result += name_bytes                     # 0x1C: Name
+    parts.append(name_bytes)                 # 0x1C: Name
     
     # Object list (starting at 0x24)
     for obj in objects:
-        result += struct.pack('<H', 2)       # Object marker
         type_name = obj.get("type", "tank")
         type_id = obj.get("type_id") or OBJECT_TYPE_IDS.get(type_name, 47)
-        result += struct.pack('<H', type_id)
+        parts.append(_HH(2, type_id))        # Object marker + type
     
     # Tag 0x04 - always [04 00 01 00 01 00 01 00]
-    result += struct.pack('<H', 4)
-    result += struct.pack('<H', 1)
-    result += struct.pack('<H', 1)
-    result += struct.pack('<H', 1)
+    parts.append(_HHHH(4, 1, 1, 1))
     
     # Tag 0x05 - Coordinates [05 00 03 00 count x y ...]
-    result += struct.pack('<H', 5)
-    result += struct.pack('<H', 3)
-    result += struct.pack('<H', n)
+    # Gather every x, y pair and pack the whole block in one call
+    parts.append(_HHH(5, 3, n))
+    coords = []
     for obj in objects:
-        x = int(obj.get("x", 0) * 10)
-        y = int(obj.get("y", 0) * 10)
-        result += struct.pack('<H', x)
-        result += struct.pack('<H', y)
+        coords += (int(obj.get("x", 0) * 10), int(obj.get("y", 0) * 10))
+    parts.append(struct.pack(f'<{2 * n}H', *coords))
     
     # Tag 0x06 - Angle [06 00 01 00 count angles...]
-    result += struct.pack('<H', 6)
-    result += struct.pack('<H', 1)
-    result += struct.pack('<H', n)
-    for obj in objects:
-        result += struct.pack('<H', obj.get("angle", 0))
+    parts.append(_HHH(6, 1, n))
+    parts.append(struct.pack(f'<{n}H', *[obj.get("angle", 0) for obj in objects]))
     
     # Tag 0x07 - Size [07 00 00 00 count sizes...]
-    result += struct.pack('<H', 7)
-    result += struct.pack('<H', 0)
-    result += struct.pack('<H', n)
-    for obj in objects:
-        result += struct.pack('<B', obj.get("size", 100))
+    parts.append(_HHH(7, 0, n))
+    parts.append(struct.pack(f'<{n}B', *[obj.get("size", 100) for obj in objects]))
     # Pad to 2-byte alignment if odd number of objects
     if n % 2 == 1:
-        result += b'\x00'
+        parts.append(b'\x00')
     
     # Tag 0x08 - Color [08 00 02 00 count RGBA...]
-    result += struct.pack('<H', 8)
-    result += struct.pack('<H', 2)
-    result += struct.pack('<H', n)
+    parts.append(_HHH(8, 2, n))
+    rgba = bytearray()
     for obj in objects:
         color = obj.get("color", "#ffffff")
         if color.startswith("#"):
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
+            # One hex -> bytes conversion for the usual #rrggbb form
+            try:
+                rgb = bytes.fromhex(color[1:7])
+            except ValueError:
+                rgb = b""
+            if len(rgb) != 3:
+                # Anything else keeps the per-channel parse (and its errors)
+                rgb = bytes([int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)])
         else:
-            r, g, b = 255, 255, 255
-        transparency = obj.get("transparency", 0)
-        result += bytes([r, g, b, transparency])
+            rgb = b'\xff\xff\xff'
+        rgba += rgb
+        rgba.append(obj.get("transparency", 0))
+    parts.append(bytes(rgba))
     
     # Tag 0x0A - Arc angle
-    result += struct.pack('<H', 10)
-    result += struct.pack('<H', 1)
-    result += struct.pack('<H', n)
-    for obj in objects:
-        result += struct.pack('<H', obj.get("arc_angle", 0))
+    parts.append(_HHH(10, 1, n))
+    parts.append(struct.pack(f'<{n}H', *[obj.get("arc_angle", 0) for obj in objects]))
     
     # Tag 0x0B - Donut radius
-    result += struct.pack('<H', 11)
-    result += struct.pack('<H', 1)
-    result += struct.pack('<H', n)
-    for obj in objects:
-        result += struct.pack('<H', obj.get("donut_radius", 0))
+    parts.append(_HHH(11, 1, n))
+    parts.append(struct.pack(f'<{n}H', *[obj.get("donut_radius", 0) for obj in objects]))
     
     # Tag 0x0C - Reserved zeros
-    result += struct.pack('<H', 12)
-    result += struct.pack('<H', 1)
-    result += struct.pack('<H', n)
-    for _ in objects:
-        result += struct.pack('<H', 0)
+    parts.append(_HHH(12, 1, n))
+    parts.append(bytes(2 * n))
     
     # Tag 0x03 - Footer
-    result += struct.pack('<H', 3)
-    result += struct.pack('<H', 1)
-    result += struct.pack('<H', 1)
-    result += struct.pack('<H', 1)
+    parts.append(_HHHH(3, 1, 1, 1))
+    
+    result = bytearray(b"".join(parts))
     
     # Update payload size at 0x12
     payload_size = len(result) - 0x24
-    struct.pack_into('<I', result, 0x12, payload_size)
+    _I_into(result, 0x12, payload_size)
     
     return bytes(result)
 
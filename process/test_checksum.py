@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 """Test what the checksum is calculated from."""
 
+import sys
 import zlib
-from stgy_mini import decode_stgy as decode_original
+from stgy_analyze_utils import compress_levels, decode_stgy_full, zlib_levels
 
 # Known working original
 original_code = "[stgy:aV6va-fqTem+7Jrx3lj55Yz0hsqPZQq5jbkqPazMEFQleuXfDlyx90VJ07yd+MNvWVehCSfGO1BUiBuddJgItSWfdq0xH3OHJMZOGr1dJ]"
-original_binary = decode_original(original_code)
+_, original_compressed, original_binary = decode_stgy_full(original_code)
 
 # The original checksum was 0x0751493b (from the header)
 expected_checksum = 0x0751493b
@@ -14,10 +15,18 @@ expected_checksum = 0x0751493b
 print("Testing what the checksum is calculated from:")
 print(f"Expected checksum: 0x{expected_checksum:08x}")
 
+# The sample's zlib header narrows down the level it was compressed with;
+# --exhaustive sweeps every level instead
+levels = range(10) if "--exhaustive" in sys.argv else zlib_levels(original_compressed)
+print(f"Compression levels tried: {list(levels)}")
+
+# Compress once per level (6 is the zlib default); every check below reuses these
+comp_by_level = compress_levels(original_binary, [6, *levels])
+
 # Test CRC32 of various things
 tests = [
     ("raw binary", original_binary),
-    ("compressed data", zlib.compress(original_binary)),
+    ("compressed data", comp_by_level[6]),
 ]
 
 for name, data in tests:
@@ -26,9 +35,8 @@ for name, data in tests:
     print(f"  CRC32 of {name}: 0x{crc:08x} {match}")
 
 # Maybe it's compressed with a specific level?
-for level in range(10):
-    comp = zlib.compress(original_binary, level)
-    crc = zlib.crc32(comp) & 0xFFFFFFFF
+for level in levels:
+    crc = zlib.crc32(comp_by_level[level]) & 0xFFFFFFFF
     match = "MATCH!" if crc == expected_checksum else ""
     print(f"  CRC32 of compressed(level={level}): 0x{crc:08x} {match}")
 
@@ -37,9 +45,8 @@ adler = zlib.adler32(original_binary) & 0xFFFFFFFF
 print(f"  Adler32 of binary: 0x{adler:08x}")
 
 # Let's also check raw compressed data without header
-for level in range(10):
-    comp = zlib.compress(original_binary, level)
+for level in levels:
     # Remove zlib header (first 2 bytes) and footer (last 4 bytes which is adler32)
-    raw_deflate = comp[2:-4]
+    raw_deflate = comp_by_level[level][2:-4]
     crc = zlib.crc32(raw_deflate) & 0xFFFFFFFF
     print(f"  CRC32 of raw deflate(level={level}): 0x{crc:08x}")
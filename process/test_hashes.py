@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test if checksum might be xxHash, FNV, or other non-CRC algorithm."""
 
+import operator
 import struct
 from stgy_mini import decode_stgy
 
@@ -25,12 +26,12 @@ def fnv1a_32(data):
 def fletcher32(data):
     if len(data) % 2:
         data = data + b'\x00'
-    words = struct.unpack('<' + 'H' * (len(data) // 2), data)
-    sum1 = 0
-    sum2 = 0
-    for word in words:
-        sum1 = (sum1 + word) % 65535
-        sum2 = (sum2 + sum1) % 65535
+    words = struct.unpack(f'<{len(data) // 2}H', data)
+    # sum2 adds up every running sum1, so word i is counted (n - i) times;
+    # reducing mod 65535 once at the end gives the same result as per step
+    n = len(words)
+    sum1 = sum(words) % 65535
+    sum2 = sum(map(operator.mul, words, range(n, 0, -1))) % 65535
     return (sum2 << 16) | sum1
 
 # DJB2 hash
@@ -76,8 +77,7 @@ def murmur3_32(data, seed=0):
     c2 = 0x1b873593
     
     nblocks = length // 4
-    for i in range(nblocks):
-        k = struct.unpack_from('<I', data, i * 4)[0]
+    for k in struct.unpack_from(f'<{nblocks}I', data):
         k = (k * c1) & 0xFFFFFFFF
         k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
         k = (k * c2) & 0xFFFFFFFF
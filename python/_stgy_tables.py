@@ -0,0 +1,171 @@
+"""
+Lookup tables shared by the strategy board decoder and encoder.
+
+Cipher tables recovered from the game binary, the per-key translate tables
+built from them with the strided translate that applies them, and the
+complete icon database from stgy.csv. The tables are built once at import.
+"""
+
+from functools import lru_cache
+
+# Cipher tables
+DAT_1420cf520 = (
+    b"\x00" * 43
+    + b"N\x00P\x00\x00xg0K8SJ2sZ\x00\x00\x00\x00\x00\x00\x00DFtT6EaVcpLMmej9XB4RY7_nOb\x00\x00\x00\x00\x00\x00i-vHCArWodIqhUlk3fy5Gw1uzQ"
+)
+
+INVERSE_DAT_1420cf4a0 = {
+    98: 45, 50: 48, 119: 49, 55: 50, 113: 51, 83: 52, 116: 53, 69: 54,
+    86: 55, 52: 56, 80: 57, 102: 65, 82: 66, 101: 67, 65: 68, 70: 69,
+    66: 70, 117: 71, 100: 72, 107: 73, 54: 74, 51: 75, 75: 76, 76: 77,
+    43: 78, 89: 79, 45: 80, 122: 81, 84: 82, 53: 83, 68: 84, 110: 85,
+    72: 86, 104: 87, 81: 88, 85: 89, 57: 90, 87: 95, 71: 97, 90: 98,
+    73: 99, 106: 100, 78: 101, 114: 102, 49: 103, 109: 104, 97: 105,
+    79: 106, 112: 107, 111: 108, 77: 109, 88: 110, 105: 111, 74: 112,
+    108: 113, 103: 114, 56: 115, 67: 116, 120: 117, 99: 118, 118: 119,
+    48: 120, 115: 121, 121: 122,
+}
+# The same substitution as a 256-byte table; unmapped bytes fall back to 'A'
+INVERSE_LUT = bytes(INVERSE_DAT_1420cf4a0.get(i, 65) for i in range(256))
+# Inverse of INVERSE_DAT_1420cf4a0 for encoding; unmapped bytes fall back to 'A'
+FORWARD_LUT = bytearray(b"A" * 256)
+for k, v in INVERSE_DAT_1420cf4a0.items():
+    FORWARD_LUT[v] = k
+FORWARD_LUT = bytes(FORWARD_LUT)
+
+# DAT_1420cf520 inverted: mapped key character -> source key character (0 if none)
+KEY_REVERSE = bytearray(256)
+for i, mapped in enumerate(DAT_1420cf520):
+    if mapped:
+        KEY_REVERSE[mapped] = i
+KEY_REVERSE = bytes(KEY_REVERSE)
+
+# URL-safe base64 alphabet: B64_ALPHABET[v] is the character for value v
+B64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+# URL-safe base64 character -> value (anything else maps to 0, like 'A')
+B64_TO_VAL = bytes(max(B64_ALPHABET.find(i), 0) for i in range(256))
+
+# ENCODE_SHIFT[s]: standard base64 character -> share code byte for
+# (value + s) & 63, folding the '+'/'/' -> '-'/'_' swap, the shift and the
+# INVERSE_DAT_1420cf4a0 inverse (FORWARD_LUT) into one table
+_STD_TO_URLSAFE = bytes.maketrans(b"+/", b"-_")
+ENCODE_SHIFT = [
+    bytes(FORWARD_LUT[B64_ALPHABET[(B64_TO_VAL[_STD_TO_URLSAFE[c]] + s) & 63]] for c in range(256))
+    for s in range(64)
+]
+
+
+@lru_cache(maxsize=64)
+def encode_tables(key):
+    """Encode translate table for each position mod 64 under the given key."""
+    return tuple(ENCODE_SHIFT[(i + key) & 63] for i in range(64))
+
+
+# DECODE_SHIFT[s]: share code byte -> standard base64 character for
+# (value - s) & 63, folding the INVERSE_DAT_1420cf4a0 substitution, the shift
+# and the URL-safe '-'/'_' -> '+'/'/' swap into one table
+_STD_ALPHABET = B64_ALPHABET.translate(bytes.maketrans(b"-_", b"+/"))
+DECODE_SHIFT = [
+    bytes(_STD_ALPHABET[(B64_TO_VAL[INVERSE_LUT[c]] - s) & 63] for c in range(256))
+    for s in range(64)
+]
+
+
+@lru_cache(maxsize=64)
+def decode_tables(key):
+    """Decode translate table for each position mod 64 under the given key."""
+    return tuple(DECODE_SHIFT[(i + key) & 63] for i in range(64))
+
+
+def cipher_translate(data, tables):
+    """Translate each byte of data with tables[i % 64] for its position i."""
+    # Characters 64 apart share the same (i + key) shift, so this is one
+    # translate pass per stride instead of one Python step per character
+    out = bytearray(len(data))
+    for i, table in enumerate(tables[:len(data)]):
+        out[i::64] = data[i::64].translate(table)
+    return out
+
+
+# Complete icon types from stgy.csv
+ICON_TYPES = {
+    # Field backgrounds (type 1)
+    4: "checkered_circle", 8: "checkered_square",
+    124: "grey_circle", 125: "grey_square",
+    
+    # AoE/Mechanics (type 6)
+    9: "circle_aoe", 10: "fan_aoe", 11: "line_aoe", 12: "line",
+    13: "gaze", 14: "stack", 15: "line_stack", 16: "proximity",
+    17: "donut", 106: "stack_multi", 107: "proximity_player",
+    108: "tankbuster", 109: "radial_knockback", 110: "linear_knockback",
+    111: "tower", 112: "targeting", 126: "moving_circle_aoe",
+    127: "1person_aoe", 128: "2person_aoe", 129: "3person_aoe", 130: "4person_aoe",
+    
+    # Base classes (type 2)
+    18: "gladiator", 19: "pugilist", 20: "marauder", 21: "lancer",
+    22: "archer", 23: "conjurer", 24: "thaumaturge", 25: "arcanist", 26: "rogue",
+    
+    # Jobs (type 2)
+    27: "paladin", 28: "monk", 29: "warrior", 30: "dragoon", 31: "bard",
+    32: "white_mage", 33: "black_mage", 34: "summoner", 35: "scholar",
+    36: "ninja", 37: "machinist", 38: "dark_knight", 39: "astrologian",
+    40: "samurai", 41: "red_mage", 42: "blue_mage", 43: "gunbreaker",
+    44: "dancer", 45: "reaper", 46: "sage", 101: "viper", 102: "pictomancer",
+    
+    # Role markers (type 2)
+    47: "tank", 48: "tank_1", 49: "tank_2",
+    50: "healer", 51: "healer_1", 52: "healer_2",
+    53: "dps", 54: "dps_1", 55: "dps_2", 56: "dps_3", 57: "dps_4",
+    118: "melee_dps", 119: "ranged_dps", 120: "physical_ranged_dps",
+    121: "magical_ranged_dps", 122: "pure_healer", 123: "barrier_healer",
+    
+    # Enemies (type 3)
+    60: "small_enemy", 62: "medium_enemy", 64: "large_enemy",
+    
+    # Target markers (type 3)
+    65: "attack_1", 66: "attack_2", 67: "attack_3", 68: "attack_4",
+    69: "attack_5", 115: "attack_6", 116: "attack_7", 117: "attack_8",
+    70: "bind_1", 71: "bind_2", 72: "bind_3",
+    73: "ignore_1", 74: "ignore_2",
+    
+    # Chain markers (type 3)
+    75: "square_marker", 76: "circle_marker", 77: "plus_marker", 78: "triangle_marker",
+    
+    # Waymarks (type 3)
+    79: "waymark_a", 80: "waymark_b", 81: "waymark_c", 82: "waymark_d",
+    83: "waymark_1", 84: "waymark_2", 85: "waymark_3", 86: "waymark_4",
+    
+    # Shapes (type 4)
+    87: "shape_circle", 88: "shape_x", 89: "shape_triangle", 90: "shape_square",
+    94: "up_arrow", 100: "text", 103: "rotate",
+    135: "highlighted_circle", 136: "highlighted_x",
+    137: "highlighted_square", 138: "highlighted_triangle",
+    139: "rotate_clockwise", 140: "rotate_counterclockwise",
+    
+    # Effects (type 3)
+    113: "enhancement", 114: "enfeeblement",
+    
+    # Lock-on markers (type 3)
+    131: "lockon_red", 132: "lockon_blue", 133: "lockon_purple", 134: "lockon_green",
+    
+    # Groups (type 5)
+    105: "group",
+}
+
+# Reverse mapping for the encoder
+ICON_NAME_TO_ID = {v: k for k, v in ICON_TYPES.items()}
+
+BACKGROUND_TYPES = {
+    0: "none", 1: "checkered", 2: "checkered_circle",
+    3: "checkered_square", 4: "grey", 5: "grey_circle", 6: "grey_square",
+}
+
+# Board background (tag 3 footer)
+BOARD_BACKGROUND_TYPES = {
+    1: "none", 2: "checkered", 3: "checkered_circle",
+    4: "checkered_square", 5: "grey", 6: "grey_circle", 7: "grey_square",
+}
+
+# Reverse mappings for the encoder
+BACKGROUND_TYPE_IDS = {v: k for k, v in BACKGROUND_TYPES.items()}
+BOARD_BACKGROUND_TYPE_IDS = {v: k for k, v in BOARD_BACKGROUND_TYPES.items()}